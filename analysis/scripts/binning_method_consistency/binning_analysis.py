@@ -44,12 +44,25 @@ def generate_cml_data(sample_size):
     return CoupledMapLatticeGenerator(config).generate().lattice
 
 
+def get_prefix(data, sample_size):
+    """Return the first sample_size time steps of a lattice as a view.
+
+    The lattice generator is deterministic given the seed, so the prefix of a
+    long trajectory equals a freshly generated shorter one.
+    """
+    if sample_size > len(data):
+        raise ValueError(
+            f"Requested {sample_size} steps from lattice with {len(data)} steps"
+        )
+    return data[:sample_size]
+
+
 def compute_te_for_method(data, method_func):
     """Compute TE values using specified binning method."""
     metric_vals = {metric: [] for metric in METRICS}
 
     for k in range(N_MAPS - 1):
-        pair_data = data[:, [k, k + 1]]
+        pair_data = data[:, k : k + 2]
 
         try:
             bins = method_func(pair_data.flatten())
@@ -66,21 +79,33 @@ def compute_te_for_method(data, method_func):
     return {metric: np.array(vals) for metric, vals in metric_vals.items()}
 
 
-def analyze_binning_methods(sample_size, n_jobs=-1):
-    """Analyze all binning methods for a given sample size."""
+def get_results_file(sample_size):
+    """Get the path of the cached results for a sample size."""
     filename = (
         "_".join(str(m) for m in METRICS)
         + "_"
         + RESULTS_FILE_PATTERN.format(sample_size)
     )
-    results_file = DATA_DIR / filename
+    return DATA_DIR / filename
+
+
+def analyze_binning_methods(sample_size, data=None, n_jobs=-1):
+    """Analyze all binning methods for a given sample size.
+
+    If data is given, its prefix of sample_size steps is analyzed instead of
+    generating a new lattice.
+    """
+    results_file = get_results_file(sample_size)
 
     # Check if results already exist
     if results_file.exists():
         with open(results_file, "rb") as f:
             return pickle.load(f)
 
-    data = generate_cml_data(sample_size)
+    if data is None:
+        data = generate_cml_data(sample_size)
+    else:
+        data = get_prefix(data, sample_size)
 
     def process_method(method_item):
         method_name, method_func = method_item
@@ -180,10 +205,15 @@ def plot_criterion_comparison_shaded_subplots_by_type(results_by_size, metric: M
 
 def main():
     """Run binning analysis."""
+    # Smaller sample sizes are prefixes of the longest trajectory, so generate
+    # it once for all sizes that still need to be analyzed.
+    missing = [size for size in SAMPLE_SIZES if not get_results_file(size).exists()]
+    data = generate_cml_data(max(missing)) if missing else None
+
     results_by_size = {}
     for size in SAMPLE_SIZES:
         print(f"Analyzing sample size: {size}")
-        results_by_size[size] = analyze_binning_methods(size)
+        results_by_size[size] = analyze_binning_methods(size, data)
 
     for metric in METRICS:
         plot_criterion_comparison_shaded_subplots_by_type(results_by_size, metric)
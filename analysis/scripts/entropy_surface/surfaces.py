@@ -1,7 +1,6 @@
 """Generate TE by sample size and binning detail surface plots."""
 
 import pickle
-from itertools import product
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -23,11 +22,6 @@ from surfaces_constant import (
     maps,
 )
 
-from te_toolbox.entropies import (
-    logn_normalized_transfer_entropy,
-    normalized_transfer_entropy,
-    transfer_entropy,
-)
 from te_toolbox.systems.lattice import CMLConfig, CoupledMapLatticeGenerator
 
 NORM_STD = "sig_by_mu"
@@ -59,25 +53,76 @@ def generate_data(map_func):
     return CoupledMapLatticeGenerator(config).generate().lattice
 
 
-def compute_te_for(data, length, n_bins):
-    """Compute TE values for length x bins combination."""
-    data_subset = data[: int(length)]
-    bins = np.linspace(np.min(data_subset), np.max(data_subset), n_bins + 1)
-
-    te_vals = []
-    nte_vals = []
-    lognte_vals = []
-
-    for k in range(N_MAPS - 1):
-        pair_data = data_subset[:, [k, k + 1]]
-        te_vals.append(transfer_entropy(pair_data, bins, LAG, at=(1, 0)))
-        nte_vals.append(normalized_transfer_entropy(pair_data, bins, LAG, at=(1, 0)))
-        lognte_vals.append(
-            logn_normalized_transfer_entropy(pair_data, bins, LAG, at=(1, 0))
+def discretize(data: np.ndarray, bins: np.ndarray) -> np.ndarray:
+    """Assign bin indices to all columns of data for shared uniform bin edges.
+
+    Indices are computed arithmetically from the uniform bin width instead of
+    by binary search and then corrected against the edges, so values on an
+    edge land in the same bin as with np.digitize.
+    """
+    n_bins = len(bins) - 1
+    scale = n_bins / (bins[-1] - bins[0])
+    classes: np.ndarray = ((data - bins[0]) * scale).astype(np.intp)
+    # Make rightmost bin edge inclusive
+    np.clip(classes, 0, n_bins - 1, out=classes)
+    classes -= data < bins[classes]
+    classes += (data >= bins[classes + 1]) & (classes < n_bins - 1)
+    return classes
+
+
+def label_entropy(labels: np.ndarray) -> float:
+    """Shannon entropy of the empirical distribution of integer labels."""
+    _, counts = np.unique(labels, return_counts=True)
+    p = counts / labels.size
+    return float(-np.sum(p * np.log(p)))
+
+
+def adjacent_pair_entropies(classes: np.ndarray, n_bins: int, lag: int) -> np.ndarray:
+    """Compute TE, NTE and logNTE from column k to k + 1 for all adjacent pairs.
+
+    All three measures derive from the same joint distribution of
+    (Y_t, Y_t_lag, X_t_lag) and its marginals, so these are counted once per pair.
+
+    Returns
+    -------
+        Array of shape (n_pairs, 3) holding TE, NTE and logNTE per pair.
+
+    """
+    current, lagged = classes[lag:], classes[:-lag]
+    n_pairs = classes.shape[1] - 1
+    measures = np.empty((n_pairs, 3))
+
+    for k in range(n_pairs):
+        y_t, y_lag, x_lag = current[:, k + 1], lagged[:, k + 1], lagged[:, k]
+        y_ylag = y_t * n_bins + y_lag
+        ylag_xlag = y_lag * n_bins + x_lag
+
+        h_y_ylag = label_entropy(y_ylag)
+        h_ylag_xlag = label_entropy(ylag_xlag)
+        h_y_ylag_xlag = label_entropy(y_ylag * n_bins + x_lag)
+        h_ylag = label_entropy(y_lag)
+
+        te = h_y_ylag + h_ylag_xlag - h_y_ylag_xlag - h_ylag
+        h_y_given_ylag = h_y_ylag - h_ylag
+        nte = (
+            1 - (h_y_ylag_xlag - h_ylag_xlag) / h_y_given_ylag
+            if h_y_given_ylag != 0
+            else 0
         )
+        measures[k] = te, nte, te / np.log(n_bins)
+
+    return measures
+
+
+def compute_te_for(data_subset, n_bins, dmin, dmax):
+    """Compute TE values for a data subset and number of bins."""
+    bins = np.linspace(dmin, dmax, n_bins + 1)
+
+    classes = discretize(data_subset, bins)
+    measures = adjacent_pair_entropies(classes, n_bins, LAG)
 
     results = {}
-    for vals, keys in [(te_vals, "TE"), (nte_vals, "NTE"), (lognte_vals, "logNTE")]:
+    for vals, keys in zip(measures.T, ["TE", "NTE", "logNTE"], strict=True):
         mean_val = np.mean(vals)
         std_val = np.std(vals)
         results[keys] = {
@@ -85,7 +130,14 @@ def compute_te_for(data, length, n_bins):
             NORM_STD: std_val / mean_val if mean_val != 0 else np.nan,
         }
 
-    return length, n_bins, results
+    return results
+
+
+def compute_row(data, i, length):
+    """Compute TE values for a sample length across all bin counts."""
+    data_subset = data[: int(length)]
+    dmin, dmax = np.min(data_subset), np.max(data_subset)
+    return i, [compute_te_for(data_subset, n_bins, dmin, dmax) for n_bins in bin_range]
 
 
 def compute_surfaces(data: np.ndarray, n_jobs=-1) -> dict:
@@ -98,35 +150,49 @@ def compute_surfaces(data: np.ndarray, n_jobs=-1) -> dict:
         for name in ["TE", "NTE", "logNTE"]
     }
 
-    params = list(product(range(len(length_range)), range(len(bin_range))))
+    # Prefix slices of a C-contiguous lattice are contiguous views
+    data = np.ascontiguousarray(data)
 
-    results = Parallel(n_jobs=n_jobs, verbose=10)(
-        delayed(compute_te_for)(data, length_range[i], bin_range[j]) for i, j in params
+    # Sample lengths are independent and write disjoint rows of the surfaces
+    rows = Parallel(n_jobs=n_jobs, verbose=10)(
+        delayed(compute_row)(data, i, length) for i, length in enumerate(length_range)
     )
 
-    for length, n_bins, measures in results:
-        i = np.where(length_range == length)[0][0]
-        j = np.where(bin_range == n_bins)[0][0]
-
-        for measure_name, measure_vals in measures.items():
-            surfaces[measure_name][MEAN][i, j] = measure_vals[MEAN]
-            surfaces[measure_name][NORM_STD][i, j] = measure_vals[NORM_STD]
+    for i, row in rows:
+        for j, measures in enumerate(row):
+            for measure_name, measure_vals in measures.items():
+                surfaces[measure_name][MEAN][i, j] = measure_vals[MEAN]
+                surfaces[measure_name][NORM_STD][i, j] = measure_vals[NORM_STD]
 
     return surfaces
 
 
 def save_surfaces(surfaces: dict, filename: str):
-    """Save computed surfaces to a pickle file."""
+    """Save computed surfaces to a compressed npz file as float32."""
     save_path = SURFACE_DATA_DIR / filename
-    with open(save_path, "wb") as f:
-        pickle.dump(surfaces, f)
+    np.savez_compressed(
+        save_path,
+        **{
+            f"{name}_{key}": values.astype(np.float32)
+            for name, surface in surfaces.items()
+            for key, values in surface.items()
+        },
+    )
 
 
 def load_surfaces(filename: str) -> dict:
-    """Load computed surfaces from a pickle file."""
+    """Load computed surfaces from a npz file or a legacy pickle file."""
     load_path = SURFACE_DATA_DIR / filename
-    with open(load_path, "rb") as f:
-        return pickle.load(f)
+    if load_path.suffix == ".pkl":
+        with open(load_path, "rb") as f:
+            return pickle.load(f)
+
+    surfaces: dict = {}
+    with np.load(load_path) as stored:
+        for stored_key in stored.files:
+            name, key = stored_key.split("_", 1)
+            surfaces.setdefault(name, {})[key] = stored[stored_key]
+    return surfaces
 
 
 def plot_measure_surface(
@@ -213,15 +279,19 @@ def main():
         print("Evaluating map", map_name)
         filename = (
             f"surfaces_{map_name}_{EPS}eps_x{N_MAPS}"
-            f"_surface_{N_LENS}data_{N_BINS}bins.pkl"
+            f"_surface_{N_LENS}data_{N_BINS}bins.npz"
         )
+        legacy_filename = filename.removesuffix(".npz") + ".pkl"
         # Check if saved surfaces exist
-        if not (SURFACE_DATA_DIR / filename).exists():
-            print("Computing and saving surfaces...")
-            surfaces = compute_and_save_surfaces(map_name, filename)
-        else:
+        if (SURFACE_DATA_DIR / filename).exists():
             print("Loading pre-computed surfaces...")
             surfaces = load_surfaces(filename)
+        elif (SURFACE_DATA_DIR / legacy_filename).exists():
+            print("Loading pre-computed legacy surfaces...")
+            surfaces = load_surfaces(legacy_filename)
+        else:
+            print("Computing and saving surfaces...")
+            surfaces = compute_and_save_surfaces(map_name, filename)
 
         # Plot surfaces with default parameters
         plot_all_surfaces(surfaces, {})
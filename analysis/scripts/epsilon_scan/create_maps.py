@@ -9,44 +9,48 @@ from eps_scan_constants import (
     SEED,
     maps,
 )
+from joblib import Parallel, delayed
 
 from te_toolbox.systems.lattice import CMLConfig, CoupledMapLatticeGenerator
 from te_toolbox.systems.maps import Map
 
 
-def create_cml(map_function: Map) -> None:
-    """Generate CML data for a given map across different coupling strengths.
+def create_cml(map_function: Map, eps: float) -> None:
+    """Generate and save CML data for a given map and coupling strength.
 
     Args:
     ----
         map_function: Map to use for the CML
+        eps: Coupling strength
 
     """
-    # Generate data for each coupling strength
-    for eps in EPSILONS:
-        print(f"Generating {map_function.__class__.__name__} with eps={eps:.2f}")
-
-        # Create configuration
-        config = CMLConfig(
-            map_function=map_function,
-            n_maps=N_MAPS,
-            coupling_strength=eps,
-            n_steps=N_ITER,
-            warmup_steps=N_TRANSIENT,
-            seed=SEED,
-            output_dir=str(EPS_DATA_DIR),
-        )
-
-        # Generate and save data
-        generator = CoupledMapLatticeGenerator(config)
-        cml = generator.generate()
-        cml.save()
-
-
-def main():
-    """Generate data for all maps."""
-    for map_function in maps.values():
-        create_cml(map_function)
+    print(f"Generating {map_function.__class__.__name__} with eps={eps:.2f}")
+
+    # Create configuration
+    config = CMLConfig(
+        map_function=map_function,
+        n_maps=N_MAPS,
+        coupling_strength=eps,
+        n_steps=N_ITER,
+        warmup_steps=N_TRANSIENT,
+        seed=SEED,
+        output_dir=str(EPS_DATA_DIR),
+    )
+
+    # Generate and save data
+    generator = CoupledMapLatticeGenerator(config)
+    cml = generator.generate()
+    cml.save()
+
+
+def main(n_jobs: int = -1):
+    """Generate data for all maps and coupling strengths in parallel."""
+    # Every (map, eps) lattice is independent and seeded by its own config
+    Parallel(n_jobs=n_jobs)(
+        delayed(create_cml)(map_function, eps)
+        for map_function in maps.values()
+        for eps in EPSILONS
+    )
 
 
 if __name__ == "__main__":
@@ -199,7 +199,7 @@ def analyze_map(  # noqa: PLR0913 # Script analysis takes some lines sometimes..
             lognte_vals = []
 
             for k in range(N_MAPS - 1):  # -1 because we look at pairs
-                pair_data = lattice[:, [k, k + 1]]
+                pair_data = lattice[:, k : k + 2]
 
                 te, nte, lognte = pairwise_tes(pair_data, bins)
                 te_vals.append(te)
@@ -6,6 +6,7 @@ from math import lgamma, log
 
 import numpy as np
 import numpy.typing as npt
+from scipy.special import gammaln, xlogy
 
 logger = logging.getLogger(__name__)
 
@@ -51,71 +52,128 @@ def optimize_bins(  # noqa: PLR0913 # Useful optimization parameters and interna
     min_edges = 3
     max_edges = min(n, int(np.sqrt(n) * 10)) + 1
 
-    costs = []
+    dmin, dmax = np.min(data), np.max(data)
+    evaluate = _cost_evaluator(data, cost_function, dmin, dmax)
+
+    # The initial window is always evaluated, even beyond max_edges
+    candidates = list(range(min_edges, max(max_edges, min_edges + window_size)))
+    best_idx, stopped = _scan(
+        candidates,
+        evaluate,
+        minimize,
+        window_size=window_size,
+        trend_patience=trend_patience,
+        stationary_threshold=stationary_threshold,
+    )
+
+    if not stopped and max_edges < n:
+        logger.warning(
+            f"Warning: exited bin optimization after {max_edges} bins without "
+            f"identifying optimum. Method: {method}."
+        )
+
+    best_n = candidates[best_idx]
+
+    logger.info(f"optimization yield: {best_n} bin edges")
+    return np.linspace(dmin, dmax, best_n)
+
+
+def _is_better(cost: float, best_cost: float, minimize: bool) -> bool:
+    return cost < best_cost if minimize else cost > best_cost
+
+
+def _scan(  # noqa: PLR0913 # Forwards the optimize_bins stopping parameters
+    candidates: list[int],
+    evaluate: Callable[[int], float],
+    minimize: bool,
+    *,
+    window_size: int,
+    trend_patience: int,
+    stationary_threshold: float,
+) -> tuple[int, bool]:
+    """Evaluate candidate bin edge counts in order until the cost stops improving.
+
+    Return the index of the best candidate and whether the scan stopped early.
+    """
     best_cost = float("inf") if minimize else float("-inf")
-    best_n = min_edges
+    best_idx = 0
+    # Ring buffer of the most recent window_size costs for the moving average
+    window = np.empty(min(window_size, len(candidates)))
 
     # Walk initial window size for moving average calculation
-    for n_bins in range(min_edges, min_edges + window_size):
-        bins = np.linspace(np.min(data), np.max(data), n_bins)
-        hist, _ = np.histogram(data, bins)
-        cost = cost_function(hist, bins)
-        costs.append(cost)
+    for idx, n_edges in enumerate(candidates[:window_size]):
+        cost = evaluate(n_edges)
+        window[idx] = cost
 
-        if (minimize and cost < best_cost) or (not minimize and cost > best_cost):
+        if _is_better(cost, best_cost, minimize):
             best_cost = cost
-            best_n = n_bins
+            best_idx = idx
 
     worse_trend_count = 0
     stationary_count = 0
-    last_avg = np.mean(costs[-window_size:])
+    last_avg = window.mean()
 
-    for n_bins in range(min_edges + window_size, max_edges):
-        bins = np.linspace(np.min(data), np.max(data), n_bins)
-        hist, _ = np.histogram(data, bins)
-        cost = cost_function(hist, bins)
-        costs.append(cost)
+    for idx, n_edges in enumerate(candidates[window_size:], start=window_size):
+        cost = evaluate(n_edges)
+        window[idx % window_size] = cost
 
-        if (minimize and cost < best_cost) or (not minimize and cost > best_cost):
+        if _is_better(cost, best_cost, minimize):
             best_cost = cost
-            best_n = n_bins
+            best_idx = idx
 
             worse_trend_count = 0
             stationary_count = 0
 
-        if len(costs) >= window_size:
-            current_avg = np.mean(costs[-window_size:])
-            rel_change = (
-                abs((current_avg - last_avg) / abs(last_avg))
-                if last_avg != 0
-                else last_avg
-            )
-            is_stationary = rel_change < stationary_threshold
-            stationary_count = (stationary_count + 1) if is_stationary else 0
-
-            if minimize:
-                relative_to_best = current_avg / (best_cost + 10e-10)
-            else:
-                relative_to_best = best_cost / (current_avg + 10e-10)
-
-            far_from_peak = relative_to_best > 1 + 0.05
-            if far_from_peak:
-                worse_trend_count += 1
-            else:
-                worse_trend_count = 0
-
-            if worse_trend_count > trend_patience or stationary_count > trend_patience:
-                break
-            last_avg = current_avg
-    else:
-        if max_edges < n:
-            logger.warning(
-                f"Warning: exited bin optimization after {max_edges} bins without "
-                f"identifying optimum. Method: {method}."
-            )
+        current_avg = window.mean()
+        rel_change = (
+            abs((current_avg - last_avg) / abs(last_avg)) if last_avg != 0 else last_avg
+        )
+        is_stationary = rel_change < stationary_threshold
+        stationary_count = (stationary_count + 1) if is_stationary else 0
+
+        if minimize:
+            relative_to_best = current_avg / (best_cost + 10e-10)
+        else:
+            relative_to_best = best_cost / (current_avg + 10e-10)
+
+        far_from_peak = relative_to_best > 1 + 0.05
+        if far_from_peak:
+            worse_trend_count += 1
+        else:
+            worse_trend_count = 0
 
-    logger.info(f"optimization yield: {best_n} bin edges")
-    return np.linspace(np.min(data), np.max(data), best_n)
+        if worse_trend_count > trend_patience or stationary_count > trend_patience:
+            return best_idx, True
+        last_avg = current_avg
+
+    return best_idx, False
+
+
+def _cost_evaluator(
+    data: npt.NDArray[np.float64],
+    cost_function: Callable[[npt.NDArray[np.float64], npt.NDArray[np.float64]], float],
+    dmin: float,
+    dmax: float,
+) -> Callable[[int], float]:
+    """Get cost of the histogram on n_edges equidistant edges spanning the data.
+
+    The edges are built per candidate, since np.histogram counts faster with
+    an explicit edge array than from a bin count and range.
+    """
+    flat_data = np.ravel(data)
+
+    def evaluate(n_edges: int) -> float:
+        bins = np.linspace(dmin, dmax, n_edges)
+        hist, _ = np.histogram(flat_data, bins)
+        return cost_function(hist, bins)
+
+    return evaluate
+
+
+def _sum_of_squares(hist: npt.NDArray[np.integer]) -> int:
+    """Sum of squared counts, accumulated in int64 to avoid int32 overflow."""
+    counts = hist.astype(np.int64, copy=False)
+    return int(np.dot(counts, counts))
 
 
 def knuth_cost(hist: npt.NDArray[np.int64], bins: npt.NDArray[np.float64]) -> float:
@@ -139,7 +197,7 @@ def knuth_cost(hist: npt.NDArray[np.int64], bins: npt.NDArray[np.float64]) -> fl
         + lgamma(m / 2)
         - lgamma(n + m / 2)
         - m * lgamma(0.5)
-        + sum(lgamma(count + 0.5) for count in hist)
+        + gammaln(hist + 0.5).sum()
     )
 
 
@@ -158,9 +216,11 @@ def shimazaki_cost(hist: npt.NDArray[np.int64], bins: npt.NDArray[np.float64]) -
 
     """
     n = np.sum(hist)
+    m = len(hist)
     h = bins[1] - bins[0]
-    mean = np.mean(hist)
-    var = np.var(hist)
+    # Mean and variance from the sum and sum of squares in one pass each
+    mean = n / m
+    var = _sum_of_squares(hist) / m - mean * mean
     return float((2 * mean - var) / (h * n) ** 2)
 
 
@@ -181,10 +241,7 @@ def aic_cost(hist: npt.NDArray[np.int64], bins: npt.NDArray[np.float64]) -> floa
     n = np.sum(hist)
     m = len(hist)
     h = bins[1] - bins[0]
-    nonzero_hist = hist[hist > 0]
-    return float(
-        m + n * np.log(n) + n * np.log(h) - np.sum(nonzero_hist * np.log(nonzero_hist))
-    )
+    return float(m + n * np.log(n) + n * np.log(h) - xlogy(hist, hist).sum())
 
 
 def aicc_cost(hist: npt.NDArray[np.int64], bins: npt.NDArray[np.float64]) -> float:
@@ -218,12 +275,8 @@ def bic_cost(hist: npt.NDArray[np.int64], bins: npt.NDArray[np.float64]) -> floa
     n = np.sum(hist)
     h = bins[1] - bins[0]
     m = len(hist)
-    nonzero_hist = hist[hist > 0]
     return float(
-        np.log(n) / 2 * m
-        + n * np.log(n)
-        + n * np.log(h)
-        - np.sum(nonzero_hist * np.log(nonzero_hist))
+        np.log(n) / 2 * m + n * np.log(n) + n * np.log(h) - xlogy(hist, hist).sum()
     )
 
 
@@ -4,6 +4,7 @@ from collections.abc import Callable
 
 import numpy as np
 import numpy.typing as npt
+from scipy.fft import irfft, rfft
 
 
 def ft_surrogatization(
@@ -28,23 +29,26 @@ def ft_surrogatization(
         rng = np.random.default_rng()
 
     n_samples, n_vars = data.shape
-    surrogates = np.empty_like(data)
 
-    for i in range(n_vars):
-        fft = np.fft.rfft(data[:, i])
-        phases = 2 * np.pi * rng.random(len(fft))
+    # Transform all columns at once, split across threads by scipy.fft; phases
+    # are drawn column by column so a seeded rng yields the same surrogates as
+    # transforming columns one by one
+    fft = rfft(data, axis=0, workers=-1)
+    phases = 2 * np.pi * rng.random((n_vars, fft.shape[0])).T
 
-        # Keep DC (0 freq) and Nyquist frequency phases unchanged
-        phases[0] = 0.0
-        if n_samples % 2 == 0:
-            phases[-1] = 0.0
+    # Keep DC (0 freq) and Nyquist frequency phases unchanged
+    phases[0] = 0.0
+    if n_samples % 2 == 0:
+        phases[-1] = 0.0
 
-        fft_surr = fft * np.exp(1j * phases)
-        surr = np.real(np.fft.irfft(fft_surr, n=n_samples))
+    # Rotate by exp(i * phases) built from cos and sin, avoiding a complex exp
+    rotation = np.empty_like(fft)
+    np.cos(phases, out=rotation.real)
+    np.sin(phases, out=rotation.imag)
+    fft *= rotation
+    surrogates = irfft(fft, n=n_samples, axis=0, overwrite_x=True, workers=-1)
 
-        surrogates[:, i] = surr.ravel()
-
-    return surrogates
+    return surrogates.astype(data.dtype, copy=False)
 
 
 def noisify(
@@ -86,23 +90,29 @@ def noisify(
         raise ValueError(
             f"noise_sampler must be string or callable, got {noise_sampler}"
         )
-    noisified = data.copy()
     n_samples, n_vars = data.shape
 
     means = np.mean(data, axis=0)
-    noise = (
-        amplitude
-        * means[None, :]
-        * noise_sampler((n_samples, n_vars), **sampler_params)
-    )
-    noisified += noise
-    return noisified
+    noise = np.asarray(noise_sampler((n_samples, n_vars), **sampler_params))
+    # Scale and shift the noise in place to avoid data sized temporaries.
+    # Built-in samplers return fresh arrays of the data shape, custom ones
+    # may return broadcastable noise and are copied first.
+    dtype = np.result_type(noise, means)
+    if isinstance(noise_distribution, str) and noise.dtype == dtype:
+        noisified = noise
+    else:
+        noisified = np.array(np.broadcast_to(noise, data.shape), dtype=dtype)
+    noisified *= amplitude * means
+    noisified += data
+    return noisified.astype(data.dtype, casting="same_kind", copy=False)
 
 
 def remap_to(
     data: npt.NDArray[np.float64],
     distribution: npt.NDArray[np.float64],
     rng: np.random.Generator | None = None,
+    *,
+    sorted_distribution: npt.NDArray[np.float64] | None = None,
 ) -> npt.NDArray[np.float64]:
     """
     Perform a rank-ordered remapping of  distribution onto data.
@@ -112,6 +122,10 @@ def remap_to(
         data: Source data array of shape (n_timesteps, n_variables) or (n_timesteps)
         distribution: Target distribution array of shape (n_timesteps, n_variables)
         rng: Optional random number generator for tie-breaking
+        sorted_distribution: Optional np.sort(distribution, axis=0) to reuse
+            across calls with the same distribution instead of sorting it again.
+            Only its shape is checked, the caller is responsible for passing
+            the sorted distribution.
 
     Returns:
     -------
@@ -125,6 +139,13 @@ def remap_to(
         raise ValueError(
             f"Shape mismatch: data {data_2d.shape} != distribution {distribution.shape}"
         )
+    if sorted_distribution is not None and (
+        sorted_distribution.shape != distribution.shape
+    ):
+        raise ValueError(
+            f"Shape mismatch: sorted_distribution {sorted_distribution.shape} "
+            f"!= distribution {distribution.shape}"
+        )
     if rng is not None:
         # Add tiny random noise for tie-breaking
         random_noise = rng.random(size=data_2d.shape) * 1e-10
@@ -132,9 +153,30 @@ def remap_to(
     else:
         data_with_noise = data_2d
 
-    ranks = np.argsort(np.argsort(data_with_noise, axis=0), axis=0)
-    sorted_dist = np.sort(dist_2d, axis=0)
-    result = sorted_dist[ranks, np.arange(data_2d.shape[1])]
+    # Work on contiguous rows of the transposes so each variable is sorted
+    # in place without strided access
+    if sorted_distribution is None:
+        sorted_dist = np.array(dist_2d.T, dtype=np.float64, order="C")
+        sorted_dist.sort(axis=1)
+    else:
+        sorted_dist = np.array(
+            sorted_distribution.reshape(dist_2d.shape).T, dtype=np.float64, order="C"
+        )
+    result = np.empty_like(sorted_dist)
+    _remap_columns(np.ascontiguousarray(data_with_noise.T), sorted_dist, result)
 
     # Return 1D if input was 1D
-    return np.array(result.flatten() if data.ndim == 1 else result, dtype=np.float64)
+    return result.ravel() if data.ndim == 1 else np.ascontiguousarray(result.T)
+
+
+def _remap_columns(
+    data: npt.NDArray[np.float64],
+    sorted_dist: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64],
+) -> None:
+    """Write each row of sorted_dist into out in the rank order of data's row.
+
+    Scattering the sorted values to the positions of the sorted data assigns
+    each value by rank without inverting the permutation.
+    """
+    np.put_along_axis(out, np.argsort(data, axis=1), sorted_dist, axis=1)
@@ -15,12 +15,16 @@ from te_toolbox.binning.rules import (
     sturges_bins,
 )
 from te_toolbox.binning.statistical import (
+    _scan,
     aic_bins,
     aic_cost,
+    aicc_cost,
     bic_bins,
     bic_cost,
+    cv_cost,
     knuth_bins,
     knuth_cost,
+    optimize_bins,
     shimazaki_bins,
     shimazaki_cost,
     small_sample_akaike_bins,
@@ -280,6 +284,80 @@ def test_bic_cost_calculation():
     np.testing.assert_allclose(actual_cost, expected_cost)
 
 
+def test_scan_finds_optimum_and_stops_early():
+    """Test the candidate scan returns the best index and stops past it."""
+    optimum = 30
+    candidates = list(range(3, 500))
+    evaluated = []
+
+    def cost(n_edges: int) -> float:
+        evaluated.append(n_edges)
+        return (n_edges - optimum) ** 2
+
+    best_idx, stopped = _scan(
+        candidates,
+        cost,
+        minimize=True,
+        window_size=20,
+        trend_patience=10,
+        stationary_threshold=1e-3,
+    )
+    assert candidates[best_idx] == optimum
+    assert stopped and len(evaluated) < len(candidates)
+
+    best_idx, _ = _scan(
+        candidates,
+        lambda n_edges: -((n_edges - optimum) ** 2),
+        minimize=False,
+        window_size=20,
+        trend_patience=10,
+        stationary_threshold=1e-3,
+    )
+    assert candidates[best_idx] == optimum
+
+
+def test_optimize_bins_scans_initial_window_on_tiny_data():
+    """Test the initial window is scanned even past the data size."""
+    data = np.linspace(0, 1, 8)
+    target = 15
+    evaluated = []
+
+    def target_cost(hist, bins):
+        evaluated.append(len(bins))
+        return (len(bins) - target) ** 2
+
+    assert len(optimize_bins(data, target_cost, window_size=20)) == target
+    assert evaluated == list(range(3, 23))
+    assert len(knuth_bins(data)) == len(optimize_bins(data, knuth_cost, False))
+
+
+def test_cost_functions_accept_int32_counts():
+    """Test squared count sums do not overflow for int32 histograms."""
+    hist = np.array([60_000, 50_000, 10], dtype=np.int32)
+    bins = np.linspace(0.0, 1.0, len(hist) + 1)
+
+    for cost_function in [
+        knuth_cost,
+        shimazaki_cost,
+        aic_cost,
+        aicc_cost,
+        bic_cost,
+        cv_cost,
+    ]:
+        expected = cost_function(hist.astype(np.int64), bins)
+        np.testing.assert_allclose(cost_function(hist, bins), expected, rtol=1e-10)
+
+
+def test_statistical_bins_on_constant_data():
+    """Test constant data gets the minimal binning instead of raising."""
+    data = np.ones(50)
+
+    # A zero bin width makes the costs -inf, which numpy warns about
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for method in [aic_bins, bic_bins, small_sample_akaike_bins]:
+            np.testing.assert_array_equal(method(data), np.ones(3))
+
+
 def test_consistency():
     """Test consistency of binning methods with same input."""
     np.random.seed(42)
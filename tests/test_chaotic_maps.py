@@ -14,13 +14,13 @@ def sample_data():
 
 def lyapunov_exponent(map_func, x0, n_iter=1000):
     """Approximate the Lyapunov exponent for a map."""
+    # Only the orbit is sequential; the log-derivatives are averaged in one pass.
+    orbit = np.empty((n_iter, *np.shape(x0)))
     x = x0
-    exponent_sum = np.zeros_like(x)
-    for _ in range(n_iter):
-        derivative = map_func.derivative(x)
-        exponent_sum += np.log(abs(derivative))
+    for i in range(n_iter):
+        orbit[i] = x
         x = map_func(x)
-    return exponent_sum / n_iter
+    return np.log(np.abs(map_func.derivative(orbit))).mean(axis=0)
 
 
 def test_tent_map_known_values():
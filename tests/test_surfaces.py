@@ -0,0 +1,63 @@
+"""Test the entropy surface script against the library entropies."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from te_toolbox.entropies import (
+    logn_normalized_transfer_entropy,
+    normalized_transfer_entropy,
+    transfer_entropy,
+)
+from te_toolbox.systems.lattice import CMLConfig, CoupledMapLatticeGenerator
+from te_toolbox.systems.maps import LogisticMap
+
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+pytest.importorskip("joblib")
+
+sys.path.insert(
+    0, str(Path(__file__).parents[1] / "analysis" / "scripts" / "entropy_surface")
+)
+from surfaces import adjacent_pair_entropies, discretize
+
+LAG = 1
+
+
+@pytest.fixture(scope="module")
+def lattice():
+    """Generate a short coupled map lattice."""
+    config = CMLConfig(
+        map_function=LogisticMap(r=4),
+        n_maps=4,
+        coupling_strength=0.5,
+        n_steps=500,
+        warmup_steps=100,
+        seed=42,
+    )
+    return CoupledMapLatticeGenerator(config).generate().lattice
+
+
+@pytest.mark.parametrize("n_bins", [2, 7, 30])
+def test_adjacent_pair_entropies_match_library(lattice, n_bins):
+    """Test the shared count TE, NTE and logNTE agree with the library."""
+    bins = np.linspace(lattice.min(), lattice.max(), n_bins + 1)
+    measures = adjacent_pair_entropies(discretize(lattice, bins), n_bins, LAG)
+
+    for k, (te, nte, lognte) in enumerate(measures):
+        pair_data = lattice[:, k : k + 2]
+        np.testing.assert_allclose(
+            te, transfer_entropy(pair_data, bins, LAG, at=(1, 0)), atol=1e-10
+        )
+        np.testing.assert_allclose(
+            nte,
+            normalized_transfer_entropy(pair_data, bins, LAG, at=(1, 0)),
+            atol=1e-10,
+        )
+        np.testing.assert_allclose(
+            lognte,
+            logn_normalized_transfer_entropy(pair_data, bins, LAG, at=(1, 0)),
+            atol=1e-10,
+        )